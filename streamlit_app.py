@@ -2,6 +2,7 @@ import io
 import os
 import base64
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -21,10 +22,13 @@ def _logo_path(name: str) -> str:
     return os.path.join(os.path.dirname(__file__), "files", "Logos", name)
 
 
+@st.cache_data(show_spinner=False)
 def _load_logo(name: str) -> str:
     """Read a logo file and return a base64-encoded string.
 
-    The returned string can be embedded directly in an ``<img>`` tag.
+    The returned string can be embedded directly in an ``<img>`` tag.  The
+    logos never change while the server is running; ``st.cache_data`` keeps
+    the encoded value across Streamlit reruns so the file is only read once.
     """
     path = _logo_path(name)
     if not os.path.exists(path):
@@ -33,6 +37,7 @@ def _load_logo(name: str) -> str:
         return base64.b64encode(f.read()).decode()
 
 
+@st.cache_data(show_spinner=False)
 def _make_logo_html(theme: str | None) -> str:
     """Return HTML/CSS string showing the correct logo for ``theme``.
 
@@ -45,6 +50,9 @@ def _make_logo_html(theme: str | None) -> str:
     semi-transparent background (light or dark depending on theme) ensures the
     logo remains readable.  We add padding on ``.stApp`` so the logo doesn't
     overlap the main title.
+
+    The result only depends on ``theme``; ``st.cache_data`` keeps it across
+    reruns so the markup is built once per theme rather than on every run.
     """
     light_b64 = _load_logo("light.png")
     dark_b64 = _load_logo("Dark.png")
@@ -92,9 +100,29 @@ def _inject_logos() -> None:
     st.markdown(_make_logo_html(theme), unsafe_allow_html=True)
 
 
-# always inject logos when the module is loaded; Streamlit ignores the call
-# outside of the server process and the tests only rely on ``_load_logo``
-_inject_logos()
+def _in_streamlit_runtime() -> bool:
+    """Return ``True`` when the script is executed by a Streamlit server.
+
+    Plain imports (as done by the tests) have no script run context; rendering
+    there is a no-op, so callers can skip building the markup altogether.
+    """
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        # older Streamlit releases: keep rendering unconditionally
+        return True
+    try:
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except TypeError:
+        # releases before ``suppress_warning`` was added
+        ctx = get_script_run_ctx()
+    return ctx is not None
+
+
+# inject logos when the app runs; a bare import (the tests only rely on
+# ``_load_logo``) skips encoding the logos and building the HTML
+if _in_streamlit_runtime():
+    _inject_logos()
 
 
 def _render_title() -> None:
@@ -132,6 +160,76 @@ uploaded_file = st.file_uploader(
 )
 
 
+# xlsxwriter formats whole columns at once; openpyxl (always installed for
+# reading) is kept as a fallback writer
+try:
+    import xlsxwriter  # noqa: F401
+
+    _EXCEL_WRITER_ENGINE = "xlsxwriter"
+except ImportError:
+    _EXCEL_WRITER_ENGINE = "openpyxl"
+
+# columns the original statement must provide
+_REQUIRED_COLUMNS = (
+    "Operation DT",
+    "Detailed description",
+    "Reference",
+    "Debit",
+    "Credit",
+)
+
+# columns read as text from the original statement; declaring them up front
+# lets pandas skip per-column type inference.  Arrow-backed strings keep the
+# text in contiguous buffers and let the ``.str`` methods run on pyarrow's
+# compute kernels.  The converted text columns use the same dtype.  Debit and
+# Credit are left to inference on purpose: columns Excel already stores as
+# numbers should stay numeric and skip the text parsing in
+# ``_parse_amount_series``.
+_TEXT_DTYPE = "string[pyarrow]"
+_TEXT_DTYPES = {
+    "Detailed description": _TEXT_DTYPE,
+    "Reference": _TEXT_DTYPE,
+}
+
+# pattern used when parsing text amounts.  Kept as a plain string: pandas only
+# hands uncompiled patterns to pyarrow, a ``re.Pattern`` falls back to a
+# per-element Python loop.
+_AMOUNT_STRIP_PATTERN = r"[^0-9.\-]"
+
+# ``infer_dtype`` results for object columns that contain only numbers
+_NUMERIC_INFERRED_TYPES = ("empty", "integer", "floating", "mixed-integer-float")
+
+
+def _parse_amount_series(s: pd.Series) -> pd.Series:
+    """Return a float Series parsed from various amount formats.
+
+    Accepts things like:
+      - 1234
+      - "1234.56"
+      - "1 234,56" (space as thousands sep, comma as decimal)
+      - "665,00"  (comma decimal)
+      - None/NaN -> 0.0
+
+    The whole column is processed with vectorized ``.str`` operations rather
+    than parsing cell by cell; anything that still isn't a number becomes 0.0.
+    Columns that already hold numbers - numeric dtypes, or object columns
+    mixing numbers with blanks - skip the string handling entirely.
+    """
+    if pd.api.types.is_numeric_dtype(s):
+        return s.fillna(0.0).astype("float64")
+    if pd.api.types.infer_dtype(s, skipna=True) in _NUMERIC_INFERRED_TYPES:
+        return pd.to_numeric(s).fillna(0.0).astype("float64")
+    text = (
+        s.astype(_TEXT_DTYPE)
+        # replace comma decimal with dot
+        .str.replace(",", ".", regex=False)
+        # drop any non-digit/dot/minus characters (spaces, non-breaking
+        # spaces and text suffixes included)
+        .str.replace(_AMOUNT_STRIP_PATTERN, "", regex=True)
+    )
+    return pd.to_numeric(text, errors="coerce").fillna(0.0).astype("float64")
+
+
 def convert_statement(df: pd.DataFrame) -> pd.DataFrame:
     """Map original columns to Odoo columns and compute Amount.
 
@@ -149,73 +247,111 @@ def convert_statement(df: pd.DataFrame) -> pd.DataFrame:
       - Amount (integer: negative for debit, positive for credit)
     """
     # ensure required columns exist
-    required = [
-        "Operation DT",
-        "Detailed description",
-        "Reference",
-        "Debit",
-        "Credit",
-    ]
-    missing = [c for c in required if c not in df.columns]
+    columns = set(df.columns)
+    missing = [c for c in _REQUIRED_COLUMNS if c not in columns]
     if missing:
         raise ValueError(f"Missing columns in original file: {missing}")
 
-    out = pd.DataFrame()
-    
-    # Format date as yyyy-mm-dd
-    out["Date"] = pd.to_datetime(df["Operation DT"]).dt.strftime("%Y-%m-%d")
-    out["Label"] = df["Detailed description"]
-    out["Reference"] = df["Reference"]
-
-    # Helper to parse amounts that may be text with commas or spaces
-    def parse_amount(val):
-        """Return a float parsed from various text formats.
-
-        Accepts things like:
-          - 1234
-          - "1234.56"
-          - "1 234,56" (space as thousands sep, comma as decimal)
-          - "665,00"  (comma decimal)
-          - None/NaN -> 0.0
-        """
-        if pd.isna(val):
-            return 0.0
-        if isinstance(val, (int, float)):
-            return float(val)
-        s = str(val).strip()
-        # remove spaces (non-breaking too)
-        s = s.replace(" ", "").replace("\xa0", "")
-        # replace comma decimal with dot
-        s = s.replace(",", ".")
-        # drop any non-digit/dot/minus characters
-        import re
-        s = re.sub(r"[^0-9.\-]", "", s)
-        try:
-            return float(s)
-        except Exception:
-            return 0.0
+    # Format date as yyyy-mm-dd; Excel date cells are already datetime64 so
+    # only text dates need parsing
+    dates = df["Operation DT"]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
 
     # Convert Debit and Credit columns handling text formats
-    debit_numeric = df["Debit"].apply(parse_amount)
-    credit_numeric = df["Credit"].apply(parse_amount)
+    debit_numeric = _parse_amount_series(df["Debit"])
+    credit_numeric = _parse_amount_series(df["Credit"])
+
+    # compute amount; debit becomes negative, keeping centimes (two decimals)
+    d = debit_numeric.to_numpy(dtype=np.float64, copy=False)
+    c = credit_numeric.to_numpy(dtype=np.float64, copy=False)
+    amount = np.round(np.where(d != 0.0, -d, c), 2)
+
+    # build the result in one go instead of assigning column by column; every
+    # column already has its final dtype (text columns that were read with
+    # ``_TEXT_DTYPES`` aren't converted again)
+    return pd.DataFrame(
+        {
+            "Date": dates.dt.strftime("%Y-%m-%d").astype(_TEXT_DTYPE),
+            "Label": df["Detailed description"].astype(_TEXT_DTYPE),
+            "Reference": df["Reference"].astype(_TEXT_DTYPE),
+            "Amount": amount,
+        },
+        copy=False,
+    )
+
+
+def read_statement(data: bytes) -> pd.DataFrame:
+    """Read the original bank statement ``data`` into a DataFrame.
+
+    pandas detects the format from the file contents rather than its name
+    (bank portals often export xlsx files named ``.xls``): xlrd handles the
+    legacy format, openpyxl - read-only in pandas - everything else.
+    """
+    return pd.read_excel(io.BytesIO(data), dtype=_TEXT_DTYPES)
+
+
+def write_odoo_xlsx(converted: pd.DataFrame) -> bytes:
+    """Return the Odoo workbook for ``converted`` as ``.xlsx`` bytes.
+
+    ``converted`` is the output of :func:`convert_statement`; the Date and
+    Amount columns get the number formats Odoo expects.
+    """
+    buffer = io.BytesIO()
+    if _EXCEL_WRITER_ENGINE == "xlsxwriter":
+        with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+            converted.to_excel(writer, index=False, sheet_name="OdooStatement")
+
+            # Apply Odoo-style formatting once per column rather than
+            # per cell: Date (column A) and Amount (column D)
+            workbook = writer.book
+            worksheet = writer.sheets["OdooStatement"]
+            date_fmt = workbook.add_format({"num_format": "yyyy-mm-dd"})
+            amount_fmt = workbook.add_format({"num_format": "0.00"})
+            worksheet.set_column("A:A", None, date_fmt)
+            worksheet.set_column("D:D", None, amount_fmt)
+    else:
+        with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+            converted.to_excel(writer, index=False, sheet_name="OdooStatement")
+
+            # Apply Odoo-style formatting using openpyxl; the number
+            # formats are registered once as named styles and cells
+            # only reference them by name
+            from openpyxl.styles import NamedStyle
+            workbook = writer.book
+            worksheet = writer.sheets["OdooStatement"]
+            workbook.add_named_style(
+                NamedStyle(name="odoo_date", number_format="yyyy-mm-dd")
+            )
+            workbook.add_named_style(
+                NamedStyle(name="odoo_amount", number_format="0.00")
+            )
+
+            # Format Date column (column A) as yyyy-mm-dd and Amount column
+            # (column D) with two decimal places in a single pass; this must
+            # happen before the writer closes and saves the workbook.  Row 1
+            # holds the header; openpyxl already tracks the last written row.
+            for r in range(2, worksheet.max_row + 1):
+                worksheet.cell(row=r, column=1).style = "odoo_date"
+                worksheet.cell(row=r, column=4).style = "odoo_amount"
+
+    return buffer.getvalue()
 
-    # compute amount; debit becomes negative
-    def compute_amount(d, c):
-        if d != 0.0:
-            return -d
-        return c
 
-    # Convert amount to float, preserving centimes (two decimal places)
-    out["Amount"] = [
-        round(compute_amount(d, c), 2) for d, c in zip(debit_numeric, credit_numeric)
-    ]
-    return out
+# Streamlit reruns the whole script on every interaction; the read and write
+# stages are pure, so cache them on their inputs (the uploaded bytes and the
+# converted frame) and only redo the work when those change.  The caches are
+# shared by every session on the server, so keep only a few recent statements
+# and drop them after an hour.
+_STATEMENT_CACHE = st.cache_data(show_spinner=False, max_entries=8, ttl="1h")
+_read_statement_cached = _STATEMENT_CACHE(read_statement)
+_write_odoo_xlsx_cached = _STATEMENT_CACHE(write_odoo_xlsx)
 
 
 if uploaded_file is not None:
     try:
         # read the excel file (support .xls and .xlsx)
-        df = pd.read_excel(uploaded_file)
+        df = _read_statement_cached(uploaded_file.getvalue())
     except ImportError as ie:
         # this typically happens if xlrd is missing for .xls files
         st.error(
@@ -229,36 +365,17 @@ if uploaded_file is not None:
 
     if df is not None:
         st.write("### Preview of original file")
-        st.dataframe(df.head())
+        st.dataframe(df.iloc[:5])
 
         try:
             converted = convert_statement(df)
             st.write("### Converted (Odoo) format")
-            st.dataframe(converted.head())
+            st.dataframe(converted.iloc[:5])
 
             # provide download
-            buffer = io.BytesIO()
-            with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-                converted.to_excel(writer, index=False, sheet_name="OdooStatement")
-                
-                # Apply Odoo-style formatting using openpyxl
-                from openpyxl.styles import numbers
-                worksheet = writer.sheets["OdooStatement"]
-                
-                # Format Date column (column A) as yyyy-mm-dd
-                for row in worksheet.iter_rows(min_row=2, max_row=len(converted)+1, min_col=1, max_col=1):
-                    for cell in row:
-                        cell.number_format = 'yyyy-mm-dd'
-                
-# Format Amount column (column D) with two decimal places
-            for row in worksheet.iter_rows(min_row=2, max_row=len(converted)+1, min_col=4, max_col=4):
-                for cell in row:
-                    cell.number_format = '0.00'  # two decimals
-            
-            buffer.seek(0)
             st.download_button(
                 label="Download Odoo bank statement",
-                data=buffer,
+                data=_write_odoo_xlsx_cached(converted),
                 file_name="Odoo_bank_statement.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             )
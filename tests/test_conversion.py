@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 import pandas as pd
@@ -8,7 +9,7 @@ root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if root not in sys.path:
     sys.path.insert(0, root)
 
-from streamlit_app import convert_statement
+from streamlit_app import convert_statement, read_statement, write_odoo_xlsx
 
 
 def make_row(op, desc, ref, debit, credit):
@@ -35,6 +36,10 @@ def test_basic_conversion():
     df = pd.DataFrame(rows)
     out = convert_statement(df)
     assert list(out.columns) == ["Date", "Label", "Reference", "Amount"]
+    # text columns are strings, Amount is a plain float column
+    for col in ("Date", "Label", "Reference"):
+        assert isinstance(out[col].dtype, pd.StringDtype)
+    assert out["Amount"].dtype == "float64"
     # Check date format is yyyy-mm-dd string
     assert out.loc[0, "Date"] == "2026-02-24"
     assert out.loc[1, "Date"] == "2026-02-25"
@@ -51,6 +56,122 @@ def test_basic_conversion():
     assert out.loc[6, "Amount"] == 4631.36
 
 
+def test_numeric_object_amounts(monkeypatch):
+    """Object columns holding only numbers and blanks parse without text.
+
+    The strip pattern is only used by the text path; an invalid one makes the
+    test fail unless the numeric fast path is taken.
+    """
+    import streamlit_app
+
+    monkeypatch.setattr(streamlit_app, "_AMOUNT_STRIP_PATTERN", "(")
+    df = pd.DataFrame(
+        {
+            "Operation DT": ["2026-02-24", "2026-02-25", "2026-02-26"],
+            "Detailed description": ["Foo", "Bar", "Baz"],
+            "Reference": ["R1", "R2", "R3"],
+            "Debit": pd.Series([50, None, 12.25], dtype=object),
+            "Credit": pd.Series([None, None, None], dtype=object),
+        }
+    )
+    out = convert_statement(df)
+    assert list(out["Amount"]) == [-50.0, 0.0, -12.25]
+
+
+def test_datetime_dates_are_formatted():
+    """Dates read from Excel arrive as datetime64 and skip text parsing."""
+    df = pd.DataFrame(
+        [
+            make_row(pd.Timestamp("2026-02-24"), "Foo", "R1", 50, None),
+            make_row(pd.Timestamp("2026-03-01 13:45"), "Bar", "R2", None, 10),
+        ]
+    )
+    assert pd.api.types.is_datetime64_any_dtype(df["Operation DT"])
+    out = convert_statement(df)
+    assert list(out["Date"]) == ["2026-02-24", "2026-03-01"]
+
+
+@pytest.mark.parametrize("engine", ["xlsxwriter", "openpyxl"])
+def test_output_xlsx_formats_amount(monkeypatch, engine):
+    """Both writers must keep the two-decimal format on the Amount column."""
+    import streamlit_app
+    from openpyxl import load_workbook
+
+    if engine == "xlsxwriter":
+        pytest.importorskip("xlsxwriter")
+    monkeypatch.setattr(streamlit_app, "_EXCEL_WRITER_ENGINE", engine)
+
+    df = pd.DataFrame(
+        [
+            make_row("2026-02-24", "Foo", "R1", 50, None),
+            make_row("2026-02-25", "Bar", "R2", None, "1 234,50"),
+        ]
+    )
+    data = write_odoo_xlsx(convert_statement(df))
+    ws = load_workbook(io.BytesIO(data))["OdooStatement"]
+    assert [c.value for c in ws[1]] == ["Date", "Label", "Reference", "Amount"]
+    assert ws["D2"].value == -50 and ws["D3"].value == 1234.5
+    assert ws["D2"].number_format == "0.00"
+    assert ws["D3"].number_format == "0.00"
+
+
+def test_read_statement_roundtrip():
+    """Text columns come back as strings and amounts still parse."""
+    buffer = io.BytesIO()
+    pd.DataFrame(
+        [
+            make_row(pd.Timestamp("2026-02-24"), "Foo", 17, 50, None),
+            make_row(pd.Timestamp("2026-02-25"), "Bar", "R2", None, "665,00"),
+        ]
+    ).to_excel(buffer, index=False)
+    df = read_statement(buffer.getvalue())
+    assert list(df["Reference"]) == ["17", "R2"]
+    out = convert_statement(df)
+    assert list(out["Date"]) == ["2026-02-24", "2026-02-25"]
+    assert list(out["Amount"]) == [-50.0, 665.0]
+
+
+def test_read_statement_numeric_amounts(monkeypatch):
+    """Amount cells stored as numbers stay numeric through the whole app path.
+
+    The strip pattern is only used for text amounts; break it so the test
+    fails if numeric cells are turned into strings and parsed back.
+    """
+    import streamlit_app
+
+    buffer = io.BytesIO()
+    pd.DataFrame(
+        [
+            make_row(pd.Timestamp("2026-02-24"), "Foo", "R1", 50, None),
+            make_row(pd.Timestamp("2026-02-25"), "Bar", "R2", None, 0.00001),
+            make_row(pd.Timestamp("2026-02-26"), "Baz", "R3", 12.25, None),
+        ]
+    ).to_excel(buffer, index=False)
+    df = read_statement(buffer.getvalue())
+    assert pd.api.types.is_numeric_dtype(df["Debit"])
+    assert pd.api.types.is_numeric_dtype(df["Credit"])
+
+    monkeypatch.setattr(streamlit_app, "_AMOUNT_STRIP_PATTERN", "(")
+    # tiny values must not be mangled through their "1e-05" text form
+    assert streamlit_app._parse_amount_series(df["Credit"])[1] == 0.00001
+    out = convert_statement(df)
+    assert list(out["Amount"]) == [-50.0, 0.0, -12.25]
+
+
+def test_read_statement_detects_format_from_contents():
+    """An xlsx export saved with a ``.xls`` name must still be readable.
+
+    Only the uploaded bytes reach :func:`read_statement`, so the reader is
+    chosen from the contents and the misleading extension can't matter.
+    """
+    buffer = io.BytesIO()
+    pd.DataFrame([make_row("2026-02-24", "Foo", "R1", None, "1 234,50")]).to_excel(
+        buffer, index=False, engine="openpyxl"
+    )
+    df = read_statement(buffer.getvalue())
+    assert convert_statement(df).loc[0, "Amount"] == 1234.5
+
+
 def test_missing_column_raises():
     df = pd.DataFrame({"Operation DT": ["x"], "Debit": [10]})
     with pytest.raises(ValueError):